@@ -1,3 +1,5 @@
+from math import sqrt
+
 import numpy as np
 
 from PEPit import PEP
@@ -5,6 +7,7 @@ from PEPit.functions import SmoothConvexFunction
 from PEPit.functions import StronglyConvexFunction
 from PEPit.functions import ConvexIndicatorFunction
 from PEPit.primitive_steps import bregman_gradient_step
+from PEPit.tools.memoize import memoize_pep
 
 
 def wc_improved_interior_algorithm(L, mu, c, lam, n, wrapper="cvxpy", solver=None, verbose=1):
@@ -54,6 +57,11 @@ def wc_improved_interior_algorithm(L, mu, c, lam, n, wrapper="cvxpy", solver=Non
     SIAM Journal on Optimization 16.3 (2006): 697-725.
     <https://epubs.siam.org/doi/pdf/10.1137/S1052623403427823>`_
 
+    Notes:
+        Worst-case guarantees are memoized on the parameters of the problem (all arguments but `verbose`):
+        a repeated call returns the stored value and prints "(PEPit) Cached result" instead of the PEPit
+        and solver outputs.
+
     Args:
         L (float): the smoothness parameter.
         mu (float): the strong-convexity parameter.
@@ -107,6 +115,46 @@ def wc_improved_interior_algorithm(L, mu, c, lam, n, wrapper="cvxpy", solver=Non
     
     """
 
+    # Solve the PEP (the worst-case guarantee is memoized on the parameters of the problem)
+    pepit_verbose = max(verbose, 0)
+    pepit_tau, solver_name = _solve_pep(L, mu, c, lam, n, wrapper, solver, verbose=pepit_verbose)
+    if solver_name.casefold() != "mosek" and pepit_verbose > 0:
+        print("\033[96m(PEPit) We recommend to use MOSEK solver. \033[0m")
+
+    # Compute theoretical guarantee (for comparison)
+    theoretical_tau = (4 * L) / (c * (n + 1) ** 2)
+
+    # Print conclusion if required
+    if verbose != -1:
+        print('*** Example file:'
+              ' worst-case performance of the Improved interior gradient algorithm in function values ***')
+        print('\tPEPit guarantee:\t F(x_n)-F_* <= {:.6} (c * Dh(xs;x0) + f1(x0) - F_*)'.format(pepit_tau))
+        print('\tTheoretical guarantee:\t F(x_n)-F_* <= {:.6} (c * Dh(xs;x0) + f1(x0) - F_*)'.format(theoretical_tau))
+
+    # Return the worst-case guarantee of the evaluated method (and the upper theoretical value)
+    return pepit_tau, theoretical_tau
+
+
+@memoize_pep(maxsize=128)
+def _solve_pep(L, mu, c, lam, n, wrapper, solver, verbose):
+    """
+    Build and solve the PEP of :func:`wc_improved_interior_algorithm`.
+
+    Results are memoized on all arguments but `verbose`, see :func:`PEPit.tools.memoize.memoize_pep`.
+
+    Returns:
+        pepit_tau (float): worst-case value.
+        solver_name (str): the name of the solver used by the wrapper.
+
+    """
+
+    # Compute the sequences of coefficients (alpha_t) and (c_t) of the method
+    alphas, cks = list(), [c]
+    for i in range(n):
+        alphak = (sqrt((cks[i] * lam) ** 2 + 4 * cks[i] * lam) - lam * cks[i]) / 2
+        alphas.append(alphak)
+        cks.append((1 - alphak) * cks[i])
+
     # Instantiate PEP
     problem = PEP()
 
@@ -128,19 +176,20 @@ def wc_improved_interior_algorithm(L, mu, c, lam, n, wrapper="cvxpy", solver=Non
     gh0, h0 = h.oracle(x0)
     g10, f10 = func1.oracle(x0)
 
+    # Define the mirror map of the Bregman gradient steps once, outside the loop
+    mirror_map = h + func2
+
     # Compute n steps of the Improved Interior Algorithm starting from x0
     x = x0
     z = x0
     g = g10
     gh = gh0
-    ck = c
     for i in range(n):
-        alphak = (np.sqrt((ck * lam) ** 2 + 4 * ck * lam) - lam * ck) / 2
-        ck = (1 - alphak) * ck
+        alphak, ck = alphas[i], cks[i + 1]
         y = (1 - alphak) * x + alphak * z
         if i >= 1:
             g, f = func1.oracle(y)
-        z, _, _ = bregman_gradient_step(g, gh, h + func2, alphak / ck)
+        z, _, _ = bregman_gradient_step(g, gh, mirror_map, alphak / ck)
         x = (1 - alphak) * x + alphak * z
         gh, _ = h.oracle(z)
 
@@ -151,23 +200,10 @@ def wc_improved_interior_algorithm(L, mu, c, lam, n, wrapper="cvxpy", solver=Non
     problem.set_performance_metric(func(x) - fs)
 
     # Solve the PEP
-    pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(wrapper=wrapper, solver=solver, verbose=pepit_verbose)
-    if problem.wrapper.solver_name.casefold() != "mosek" and verbose > 0:
-        print("\033[96m(PEPit) We recommend to use MOSEK solver. \033[0m")
-
-    # Compute theoretical guarantee (for comparison)
-    theoretical_tau = (4 * L) / (c * (n + 1) ** 2)
+    pepit_tau = problem.solve(wrapper=wrapper, solver=solver, verbose=verbose)
 
-    # Print conclusion if required
-    if verbose != -1:
-        print('*** Example file:'
-              ' worst-case performance of the Improved interior gradient algorithm in function values ***')
-        print('\tPEPit guarantee:\t F(x_n)-F_* <= {:.6} (c * Dh(xs;x0) + f1(x0) - F_*)'.format(pepit_tau))
-        print('\tTheoretical guarantee:\t F(x_n)-F_* <= {:.6} (c * Dh(xs;x0) + f1(x0) - F_*)'.format(theoretical_tau))
-
-    # Return the worst-case guarantee of the evaluated method (and the upper theoretical value)
-    return pepit_tau, theoretical_tau
+    # Return the worst-case guarantee and the solver used
+    return pepit_tau, problem.wrapper.solver_name
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ from PEPit import PEP
 from PEPit.functions import ConvexFunction
 from PEPit.functions import ConvexIndicatorFunction
 from PEPit.primitive_steps import bregman_gradient_step
+from PEPit.tools.memoize import memoize_pep
 
 
 def wc_no_lips_in_bregman_divergence(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
@@ -55,6 +56,10 @@ def wc_no_lips_in_bregman_divergence(L, gamma, n, wrapper="cvxpy", solver=None,
     Notes:
         Disclaimer: This example requires some experience with PEPit and PEPs ([2], section 4).
 
+        Worst-case guarantees are memoized on the parameters of the problem (all arguments but `verbose`):
+        a repeated call returns the stored value and prints "(PEPit) Cached result" instead of the PEPit
+        and solver outputs.
+
     Args:
         L (float): relative-smoothness parameter.
         gamma (float): step-size.
@@ -106,6 +111,35 @@ def wc_no_lips_in_bregman_divergence(L, gamma, n, wrapper="cvxpy", solver=None,
     
     """
 
+    # Solve the PEP (the worst-case guarantee is memoized on the parameters of the problem)
+    pepit_verbose = max(verbose, 0)
+    pepit_tau = _solve_pep(L, gamma, n, wrapper, solver, verbose=pepit_verbose)
+
+    # Compute theoretical guarantee (for comparison)
+    theoretical_tau = 2 / (n * (n - 1))
+
+    # Print conclusion if required
+    if verbose != -1:
+        print('*** Example file: worst-case performance of the NoLips_2 in Bregman divergence ***')
+        print('\tPEPit guarantee:\t min_t Dh(x_(t-1); x_t) <= {:.6} Dh(x_*; x_0)'.format(pepit_tau))
+        print('\tTheoretical guarantee:\t min_t Dh(x_(t-1); x_t) <= {:.6} Dh(x_*; x_0)'.format(theoretical_tau))
+
+    # Return the worst-case guarantee of the evaluated method (and the upper theoretical value)
+    return pepit_tau, theoretical_tau
+
+
+@memoize_pep(maxsize=128)
+def _solve_pep(L, gamma, n, wrapper, solver, verbose):
+    """
+    Build and solve the PEP of :func:`wc_no_lips_in_bregman_divergence`.
+
+    Results are memoized on all arguments but `verbose`, see :func:`PEPit.tools.memoize.memoize_pep`.
+
+    Returns:
+        pepit_tau (float): worst-case value.
+
+    """
+
     # Instantiate PEP
     problem = PEP()
 
@@ -130,13 +164,16 @@ def wc_no_lips_in_bregman_divergence(L, gamma, n, wrapper="cvxpy", solver=None,
     # Set the initial constraint that is the Bregman distance between x0 and x^*
     problem.set_initial_condition(hs - h0 - gh0 * (xs - x0) <= 1)
 
+    # Define the mirror map of the Bregman gradient steps once, outside the loop
+    mirror_map = func2 + h
+
     # Compute n steps of the NoLips starting from x0
     x1, x2 = x0, x0
     gfx = gf0
     ghx = gh0
     hx1, hx2 = h0, h0
     for i in range(n):
-        x2, _, _ = bregman_gradient_step(gfx, ghx, func2 + h, gamma)
+        x2, _, _ = bregman_gradient_step(gfx, ghx, mirror_map, gamma)
         gfx, _ = func1.oracle(x2)
         ghx, hx2 = h.oracle(x2)
         Dhx = hx1 - hx2 - ghx * (x1 - x2)
@@ -147,20 +184,10 @@ def wc_no_lips_in_bregman_divergence(L, gamma, n, wrapper="cvxpy", solver=None,
         problem.set_performance_metric(Dhx)
 
     # Solve the PEP
-    pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(wrapper=wrapper, solver=solver, verbose=pepit_verbose)
-
-    # Compute theoretical guarantee (for comparison)
-    theoretical_tau = 2 / (n * (n - 1))
+    pepit_tau = problem.solve(wrapper=wrapper, solver=solver, verbose=verbose)
 
-    # Print conclusion if required
-    if verbose != -1:
-        print('*** Example file: worst-case performance of the NoLips_2 in Bregman divergence ***')
-        print('\tPEPit guarantee:\t min_t Dh(x_(t-1); x_t) <= {:.6} Dh(x_*; x_0)'.format(pepit_tau))
-        print('\tTheoretical guarantee:\t min_t Dh(x_(t-1); x_t) <= {:.6} Dh(x_*; x_0)'.format(theoretical_tau))
-
-    # Return the worst-case guarantee of the evaluated method (and the upper theoretical value)
-    return pepit_tau, theoretical_tau
+    # Return the worst-case guarantee
+    return pepit_tau
 
 
 if __name__ == "__main__":
@@ -4,9 +4,10 @@ from PEPit import PEP
 from PEPit.functions import ConvexFunction
 from PEPit.functions import ConvexIndicatorFunction
 from PEPit.primitive_steps import bregman_gradient_step
+from PEPit.tools.memoize import memoize_pep
 
 
-def wc_no_lips_in_function_value(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
+def wc_no_lips_in_function_value(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1, exact=False):
     """
     Consider the constrainted composite convex minimization problem
 
@@ -57,6 +58,10 @@ def wc_no_lips_in_function_value(L, gamma, n, wrapper="cvxpy", solver=None, verb
     Notes:
         Disclaimer: This example requires some experience with PEPit and PEPs ([2], section 4).
 
+        Worst-case guarantees are memoized on the parameters of the problem (all arguments but `verbose`):
+        a repeated call returns the stored value and prints "(PEPit) Cached result" instead of the PEPit
+        and solver outputs.
+
     Args:
         L (float): relative-smoothness parameter.
         gamma (float): step-size.
@@ -69,9 +74,12 @@ def wc_no_lips_in_function_value(L, gamma, n, wrapper="cvxpy", solver=None, verb
                         - 0: This example's output.
                         - 1: This example's output + PEPit information.
                         - 2: This example's output + PEPit information + solver details.
+        exact (bool): if True and :math:`\\gamma \\leqslant \\frac{1}{L}`, the known tight guarantee
+                      is returned as worst-case value without solving the PEP.
 
     Returns:
-        pepit_tau (float): worst-case value.
+        pepit_tau (float): worst-case value. If `exact` applies, this is the closed form
+                           :math:`\\frac{1}{\\gamma n}` and no PEP is solved.
         theoretical_tau (float): theoretical value.
 
     Example:
@@ -108,6 +116,42 @@ def wc_no_lips_in_function_value(L, gamma, n, wrapper="cvxpy", solver=None, verb
     
     """
 
+    # Compute theoretical guarantee (for comparison)
+    theoretical_tau = 1 / (gamma * n)
+
+    use_exact = exact and gamma * L <= 1
+    if use_exact:
+        # The theoretical guarantee is tight for gamma <= 1/L ([2, page 23]): skip the SDP
+        pepit_tau = theoretical_tau
+    else:
+        # Solve the PEP (the worst-case guarantee is memoized on the parameters of the problem)
+        pepit_verbose = max(verbose, 0)
+        pepit_tau = _solve_pep(L, gamma, n, wrapper, solver, verbose=pepit_verbose)
+
+    # Print conclusion if required
+    if verbose != -1:
+        print('*** Example file: worst-case performance of the NoLips in function values ***')
+        if use_exact:
+            print('\tExact (known tight) guarantee:\t F(x_n) - F_* <= {:.6} Dh(x_*; x_0)'.format(pepit_tau))
+        else:
+            print('\tPEPit guarantee:\t F(x_n) - F_* <= {:.6} Dh(x_*; x_0)'.format(pepit_tau))
+        print('\tTheoretical guarantee:\t F(x_n) - F_* <= {:.6} Dh(x_*; x_0)'.format(theoretical_tau))
+    # Return the worst-case guarantee of the evaluated method (and the upper theoretical value)
+    return pepit_tau, theoretical_tau
+
+
+@memoize_pep(maxsize=128)
+def _solve_pep(L, gamma, n, wrapper, solver, verbose):
+    """
+    Build and solve the PEP of :func:`wc_no_lips_in_function_value`.
+
+    Results are memoized on all arguments but `verbose`, see :func:`PEPit.tools.memoize.memoize_pep`.
+
+    Returns:
+        pepit_tau (float): worst-case value.
+
+    """
+
     # Instantiate PEP
     problem = PEP()
 
@@ -132,12 +176,15 @@ def wc_no_lips_in_function_value(L, gamma, n, wrapper="cvxpy", solver=None, verb
     # Set the initial constraint that is the Bregman distance between x0 and x^*
     problem.set_initial_condition(hs - h0 - gh0 * (xs - x0) <= 1)
 
+    # Define the mirror map of the Bregman gradient steps once, outside the loop
+    mirror_map = func2 + h
+
     # Compute n steps of the NoLips starting from x0
     gfx = gf0
     ffx = f0
     ghx = gh0
     for i in range(n):
-        x, _, _ = bregman_gradient_step(gfx, ghx, func2 + h, gamma)
+        x, _, _ = bregman_gradient_step(gfx, ghx, mirror_map, gamma)
         gfx, ffx = func1.oracle(x)
         gdx = d.gradient(x)
         ghx = (gdx + gfx) / L
@@ -146,19 +193,10 @@ def wc_no_lips_in_function_value(L, gamma, n, wrapper="cvxpy", solver=None, verb
     problem.set_performance_metric(ffx - fs)
 
     # Solve the PEP
-    pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(wrapper=wrapper, solver=solver, verbose=pepit_verbose)
-
-    # Compute theoretical guarantee (for comparison)
-    theoretical_tau = 1 / (gamma * n)
+    pepit_tau = problem.solve(wrapper=wrapper, solver=solver, verbose=verbose)
 
-    # Print conclusion if required
-    if verbose != -1:
-        print('*** Example file: worst-case performance of the NoLips in function values ***')
-        print('\tPEPit guarantee:\t F(x_n) - F_* <= {:.6} Dh(x_*; x_0)'.format(pepit_tau))
-        print('\tTheoretical guarantee:\t F(x_n) - F_* <= {:.6} Dh(x_*; x_0)'.format(theoretical_tau))
-    # Return the worst-case guarantee of the evaluated method (and the upper theoretical value)
-    return pepit_tau, theoretical_tau
+    # Return the worst-case guarantee
+    return pepit_tau
 
 
 if __name__ == "__main__":
@@ -76,7 +76,7 @@ def wc_no_lips_1(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
         >>> L = 1
         >>> gamma = 1 / (2 * L)
         >>> pepit_tau, theoretical_tau = wc_no_lips_1(L=L, gamma=gamma, n=5, wrapper="cvxpy", solver=None, verbose=1)
-        (PEPit) Setting up the problem: size of the Gram matrix: 20x20
+        (PEPit) Setting up the problem: size of the Gram matrix: 19x19
         (PEPit) Setting up the problem: performance measure is the minimum of 5 element(s)
         (PEPit) Setting up the problem: Adding initial conditions and general constraints ...
         (PEPit) Setting up the problem: initial conditions and general constraints (1 constraint(s) added)
@@ -85,8 +85,8 @@ def wc_no_lips_1(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
         			Function 1 : 30 scalar constraint(s) added
         			Function 2 : Adding 30 scalar constraint(s) ...
         			Function 2 : 30 scalar constraint(s) added
-        			Function 3 : Adding 49 scalar constraint(s) ...
-        			Function 3 : 49 scalar constraint(s) added
+        			Function 3 : Adding 36 scalar constraint(s) ...
+        			Function 3 : 36 scalar constraint(s) added
         (PEPit) Setting up the problem: additional constraints for 0 function(s)
         (PEPit) Compiling SDP
         (PEPit) Calling SDP solver
@@ -125,19 +125,24 @@ def wc_no_lips_1(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
     gf0, f0 = func1.oracle(x0)
     _, F0 = func.oracle(x0)
 
+    # Define the mirror map of the Bregman gradient steps once, outside the loop
+    mirror_map = func2 + h
+
     # Compute n steps of the NoLips starting from x0
     xx = [x0 for _ in range(n + 1)]
     gfx = gf0
     ghx = [gh0 for _ in range(n + 1)]
     hx = [h0 for _ in range(n + 1)]
     for i in range(n):
-        xx[i + 1], _, _ = bregman_gradient_step(gfx, ghx[i], func2 + h, gamma)
+        xx[i + 1], _, _ = bregman_gradient_step(gfx, ghx[i], mirror_map, gamma)
         gfx, _ = func1.oracle(xx[i + 1])
         ghx[i + 1], hx[i + 1] = h.oracle(xx[i + 1])
         Dh = hx[i + 1] - hx[i] - ghx[i] * (xx[i + 1] - xx[i])
         # Set the performance metric to the final distance in Bregman distances to the last iterate
         problem.set_performance_metric(Dh)
-    _, Fx = func.oracle(xx[n])
+    # Both func1 and func2 have already been evaluated on the last iterate:
+    # reuse their values instead of requesting a new subgradient of func
+    Fx = func1.value(xx[n]) + func2.value(xx[n])
 
     # Set the initial constraint that is the distance in function values between x0 and x^*
     problem.set_initial_condition(F0 - Fx <= 1)
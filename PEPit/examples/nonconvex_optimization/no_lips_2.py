@@ -76,7 +76,7 @@ def wc_no_lips_2(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
         >>> L = 1
         >>> gamma = 1 / L
         >>> pepit_tau, theoretical_tau = wc_no_lips_2(L=L, gamma=gamma, n=3, wrapper="cvxpy", solver=None, verbose=1)
-        (PEPit) Setting up the problem: size of the Gram matrix: 14x14
+        (PEPit) Setting up the problem: size of the Gram matrix: 13x13
         (PEPit) Setting up the problem: performance measure is the minimum of 3 element(s)
         (PEPit) Setting up the problem: Adding initial conditions and general constraints ...
         (PEPit) Setting up the problem: initial conditions and general constraints (1 constraint(s) added)
@@ -85,8 +85,8 @@ def wc_no_lips_2(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
         			Function 1 : 12 scalar constraint(s) added
         			Function 2 : Adding 12 scalar constraint(s) ...
         			Function 2 : 12 scalar constraint(s) added
-        			Function 3 : Adding 25 scalar constraint(s) ...
-        			Function 3 : 25 scalar constraint(s) added
+        			Function 3 : Adding 16 scalar constraint(s) ...
+        			Function 3 : 16 scalar constraint(s) added
         (PEPit) Setting up the problem: additional constraints for 0 function(s)
         (PEPit) Compiling SDP
         (PEPit) Calling SDP solver
@@ -125,13 +125,16 @@ def wc_no_lips_2(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
     gf0, f0 = func1.oracle(x0)
     _, F0 = func.oracle(x0)
 
+    # Define the mirror map of the Bregman gradient steps once, outside the loop
+    mirror_map = func2 + h
+
     # Compute n steps of the NoLips starting from x0
     x1, x2 = x0, x0
     gfx = gf0
     ghx = gh0
     hx1, hx2 = h0, h0
     for i in range(n):
-        x2, _, _ = bregman_gradient_step(gfx, ghx, func2 + h, gamma)
+        x2, _, _ = bregman_gradient_step(gfx, ghx, mirror_map, gamma)
         gfx, _ = func1.oracle(x2)
         ghx, hx2 = h.oracle(x2)
         Dhx = hx1 - hx2 - ghx * (x1 - x2)
@@ -139,7 +142,9 @@ def wc_no_lips_2(L, gamma, n, wrapper="cvxpy", solver=None, verbose=1):
         x1, hx1 = x2, hx2
         # Set the performance metric to the Bregman distance to the last iterate
         problem.set_performance_metric(Dhx)
-    _, Fx = func.oracle(x2)
+    # Both func1 and func2 have already been evaluated on the last iterate:
+    # reuse their values instead of requesting a new subgradient of func
+    Fx = func1.value(x2) + func2.value(x2)
     # Set the initial constraint that is the Bregman distance between x0 and x^*
     problem.set_initial_condition(F0 - Fx <= 1)
 
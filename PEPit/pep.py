@@ -2,7 +2,7 @@ import importlib.util
 
 import numpy as np
 
-from PEPit.tools.dict_operations import prune_dict, symmetrize_dict
+from PEPit.tools.dict_operations import add_weighted_dict_inplace, merge_dict, prune_dict, symmetrize_dict
 
 from PEPit.wrappers import WRAPPERS
 from PEPit.point import Point
@@ -729,8 +729,13 @@ class PEP(object):
             if residual_min_eig_val < 0:
                 message += " up to an error of {}".format(-residual_min_eig_val)
             print(message)
+        # The linear combination of the constraints is accumulated in place in a single decomposition dict,
+        # rather than by summing Expressions, which would copy an ever-growing dict for each constraint.
         # - <Gram, residual> <= 0
-        constraints_combination = -np.dot(Point.list_of_leaf_points, np.dot(self.residual, Point.list_of_leaf_points))
+        constraints_combination_dict = dict()
+        for i, point_i in enumerate(Point.list_of_leaf_points):
+            for j, point_j in enumerate(Point.list_of_leaf_points):
+                constraints_combination_dict[(point_i, point_j)] = - self.residual[i, j]
 
         # LMI constraints
         # Dual >= 0
@@ -744,7 +749,8 @@ class PEP(object):
                 print(message)
             # - <psd_matrix, lmi_dual> <= 0
             for psd_matrix in self._list_of_psd_sent_to_wrapper:
-                constraints_combination -= np.sum(psd_matrix.eval_dual() * psd_matrix.matrix_of_expressions)
+                lmi_combination = np.sum(psd_matrix.eval_dual() * psd_matrix.matrix_of_expressions)
+                add_weighted_dict_inplace(constraints_combination_dict, lmi_combination.decomposition_dict, -1)
 
         # Scalar constraints
         # Dual of inequality constraints >= 0
@@ -760,22 +766,27 @@ class PEP(object):
                 print(message)
         # + <expression, dual> <= 0
         for constraint in self._list_of_constraints_sent_to_wrapper:
-            constraints_combination += constraint.eval_dual() * constraint.expression
+            add_weighted_dict_inplace(constraints_combination_dict,
+                                      constraint.expression.decomposition_dict,
+                                      constraint.eval_dual())
 
         # Proof reconstruction
         # At this stage, constraints_combination must be equal to "objective - tau"
         # which constitutes the proof as it has to be non-positive.
-        # Compute an expression that should be exactly equal to the constant tau.
-        dual_objective_expression = self.objective - constraints_combination
+        # Compute the decomposition dict of an expression that should be exactly equal to the constant tau.
+        dual_objective_expression_decomposition_dict = merge_dict(
+            self.objective.decomposition_dict,
+            {key: - value for key, value in constraints_combination_dict.items()}
+        )
         # Operation over the decomposition dict of dual_objective_expression
         dual_objective_expression_decomposition_dict = prune_dict(
             symmetrize_dict(
-                dual_objective_expression.decomposition_dict
+                dual_objective_expression_decomposition_dict
             )
         )
         # Get the actual dual_objective from its dict
         if 1 in dual_objective_expression_decomposition_dict.keys():
-            dual_objective = dual_objective_expression_decomposition_dict[1]
+            dual_objective = float(dual_objective_expression_decomposition_dict[1])
         else:
             dual_objective = 0.
         # Compute the remaining terms, that should be small and only due to numerical stability errors
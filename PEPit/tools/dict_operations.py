@@ -32,6 +32,34 @@ def merge_dict(dict1, dict2):
     return merged_dict
 
 
+def add_weighted_dict_inplace(dict1, dict2, weight=1):
+    """
+    Add the values of dict2, multiplied by weight, to the ones of dict1 in place.
+    If a key of dict2 is not in dict1, it is created.
+
+    Note:
+        Unlike `merge_dict`, no copy is made. This matters when summing many dictionaries into a large one.
+
+    Args:
+        dict1 (dict): the dictionary to be updated
+        dict2 (dict): any dictionary
+        weight (float): the coefficient applied to the values of dict2
+
+    Returns:
+        (dict): dict1, updated.
+
+    """
+
+    # Add all key of dict2 to dict1
+    for key, value in dict2.items():
+
+        # If in both, the values are added, otherwise the new key is created
+        dict1[key] = dict1.get(key, 0) + weight * value
+
+    # Return the updated dict
+    return dict1
+
+
 def prune_dict(my_dict):
     """
     Remove all keys associated to a null value.
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from functools import wraps
+
+
+def memoize_pep(maxsize=128):
+    """
+    Decorator memoizing a function that builds and solves a PEP, on all its arguments but `verbose`.
+
+    A call with the same positional arguments as a previous one returns the stored result without solving the PEP
+    again, and only prints a "(PEPit) Cached result" line if `verbose` is positive.
+    The least recently used results are discarded once more than `maxsize` of them are stored.
+
+    Example:
+        >>> @memoize_pep(maxsize=16)
+        ... def _solve_pep(L, n, wrapper, solver, verbose):
+        ...     problem = PEP()
+        ...     ...
+        ...     return problem.solve(wrapper=wrapper, solver=solver, verbose=verbose)
+        >>> pepit_tau = _solve_pep(1, 2, "cvxpy", None, verbose=1)
+
+    Args:
+        maxsize (int): the maximal number of stored results.
+
+    Returns:
+        (callable): a decorator. The decorated function must be called with positional (hashable) arguments
+                    and `verbose` as keyword argument.
+
+    """
+
+    def decorator(solve_pep):
+
+        cache = OrderedDict()
+
+        @wraps(solve_pep)
+        def memoized_solve_pep(*args, verbose=1):
+
+            # Return the stored result if this PEP was already solved
+            if args in cache:
+                cache.move_to_end(args)
+                if verbose > 0:
+                    print("(PEPit) Cached result: this PEP was already solved with the same parameters,"
+                          " its worst-case guarantee is returned without calling the solver again")
+                return cache[args]
+
+            # Otherwise, solve it and store the result, discarding the least recently used one if needed
+            result = solve_pep(*args, verbose=verbose)
+            cache[args] = result
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
+
+        memoized_solve_pep.cache_clear = cache.clear
+        return memoized_solve_pep
+
+    return decorator
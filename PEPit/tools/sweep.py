@@ -0,0 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+
+def _call_with_parameters(fn, common_parameters, parameters):
+    """
+    Call `fn` on the union of the common parameters and of the ones of a grid point.
+
+    """
+
+    return fn(**common_parameters, **parameters)
+
+
+def sweep(fn, grid, workers=None, **common_parameters):
+    """
+    Evaluate a worst-case function (e.g., one of the `wc_` functions of the examples) on a grid of parameters,
+    in parallel over several processes.
+
+    Note:
+        PEPit stores the leaf :class:`Point` and :class:`Expression` objects in class attributes,
+        hence PEPs cannot be built concurrently in threads. Each grid point is therefore solved in a worker process.
+        Examples memoized with :func:`PEPit.tools.memoize.memoize_pep` keep a separate cache in each worker process,
+        for the lifetime of the pool.
+        On platforms where worker processes are spawned (the default on macOS and Windows),
+        the script calling `sweep` is re-imported by each worker: call `sweep` under `if __name__ == "__main__":`.
+
+    Example:
+        >>> from PEPit.examples.unconstrained_convex_minimization import wc_gradient_descent
+        >>> from PEPit.tools.sweep import sweep
+        >>> if __name__ == "__main__":
+        ...     grid = [{"L": 1, "gamma": 1, "n": n} for n in range(1, 5)]
+        ...     results = sweep(wc_gradient_descent, grid, verbose=-1)
+
+    Args:
+        fn (callable): a picklable function (i.e., defined at the top level of a module) taking keyword arguments.
+        grid (iterable): the grid of parameters, each element being a dict of keyword arguments of fn.
+        workers (int): the maximal number of processes to use. Defaults to the number of processors on the machine.
+                       If set to 1, the grid is evaluated sequentially in the current process.
+        common_parameters: keyword arguments passed to fn for every grid point (e.g., wrapper, solver or verbose).
+
+    Returns:
+        (list): the outputs of fn, in the order of the grid.
+
+    """
+
+    # Bind the parameters shared by all grid points
+    function = partial(_call_with_parameters, fn, common_parameters)
+
+    # Evaluate sequentially if only one worker is requested
+    if workers == 1:
+        return [function(parameters) for parameters in grid]
+
+    # Otherwise, distribute the grid points over a pool of processes
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, grid))
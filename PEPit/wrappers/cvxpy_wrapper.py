@@ -1,12 +1,14 @@
 import importlib.util
 
+import numpy as np
+
 from PEPit.wrapper import Wrapper
 from PEPit.point import Point
 from PEPit.expression import Expression
 from PEPit.constraint import Constraint
 from PEPit.psd_matrix import PSDMatrix
 
-from PEPit.tools.expressions_to_matrices import expression_to_matrices
+from PEPit.tools.expressions_to_matrices import expression_to_matrices, expression_to_sparse_matrices
 
 
 class CvxpyWrapper(Wrapper):
@@ -40,6 +42,15 @@ class CvxpyWrapper(Wrapper):
         F (cvxpy.Variable): a 1D cvxpy.Variable that represents PEPit's Expressions.
         G (cvxpy.Variable): a 2D cvxpy.Variable that represents PEPit's Gram matrix.
         _list_of_solver_constraints (list of cvxpy.Constraint): the list of constraints of the problem in CVXPY format.
+        _heuristic_weight (cvxpy.Parameter): the weight matrix of the dimension-reduction heuristic objective.
+                                             Being a parameter, it can be updated without re-compiling the problem.
+        _scalar_constraints_data (dict): sparse coefficients of the scalar constraints, sorted by type
+                                         ('inequality' or 'equality'). They are stacked into one vectorized
+                                         CVXPY constraint per type when the problem is generated.
+        _scalar_solver_constraints (dict): the vectorized CVXPY constraint associated with each type.
+        _dual_references (list): for each element of _list_of_constraints_sent_to_solver,
+                                 where to read its dual variable: a couple (type, row) for a :class:`Constraint`,
+                                 the CVXPY lmi constraint for a :class:`PSDMatrix`.
 
     """
 
@@ -62,6 +73,15 @@ class CvxpyWrapper(Wrapper):
         self.F = None
         self.G = None
         self._list_of_solver_constraints = list()
+        self._heuristic_weight = None
+        self._scalar_constraints_data = {
+            equality_or_inequality: {"G_rows": list(), "G_cols": list(), "G_vals": list(),
+                                     "F_rows": list(), "F_cols": list(), "F_vals": list(),
+                                     "constants": list()}
+            for equality_or_inequality in ['inequality', 'equality']
+        }
+        self._scalar_solver_constraints = dict()
+        self._dual_references = list()
 
     def set_main_variables(self):
         """
@@ -107,8 +127,10 @@ class CvxpyWrapper(Wrapper):
 
     def send_constraint_to_solver(self, constraint):
         """
-        Transform a PEPit :class:`Constraint` into a CVXPY one
-        and add the 2 formats of the constraints into the tracking lists.
+        Store the coefficients of a PEPit :class:`Constraint` in sparse format
+        and add the :class:`Constraint` into the tracking lists.
+        All the stored scalar constraints are sent to CVXPY at once, as one vectorized constraint per type,
+        by the method `generate_problem`.
 
         Args:
             constraint (Constraint): a :class:`Constraint` object to be sent to CVXPY.
@@ -122,23 +144,33 @@ class CvxpyWrapper(Wrapper):
         # Sanity check
         assert isinstance(constraint, Constraint)
 
-        # Add constraint to the attribute _list_of_constraints_sent_to_solver to keep track of
-        # all the constraints that have been sent to CVXPY as well as the order.
-        self._list_of_constraints_sent_to_solver.append(constraint)
-
         # Distinguish equality and inequality
-        if constraint.equality_or_inequality == 'inequality':
-            cvxpy_constraint = self._expression_to_solver(constraint.expression) <= 0
-        elif constraint.equality_or_inequality == 'equality':
-            cvxpy_constraint = self._expression_to_solver(constraint.expression) == 0
-        else:
+        if constraint.equality_or_inequality not in ['inequality', 'equality']:
             # Raise an exception otherwise
             raise ValueError('The attribute \'equality_or_inequality\' of a constraint object'
                              ' must either be \'equality\' or \'inequality\'.'
                              'Got {}'.format(constraint.equality_or_inequality))
+        data = self._scalar_constraints_data[constraint.equality_or_inequality]
+        row = len(data["constants"])
 
-        # Add the corresponding CVXPY constraint to the list of constraints to be sent to CVXPY
-        self._list_of_solver_constraints.append(cvxpy_constraint)
+        # Add constraint to the attribute _list_of_constraints_sent_to_solver to keep track of
+        # all the constraints that have been sent to CVXPY as well as the order.
+        self._list_of_constraints_sent_to_solver.append(constraint)
+        self._dual_references.append((constraint.equality_or_inequality, row))
+
+        # Store the coefficients of the constraint in the row "row" of the matrices of its type.
+        # G being symmetric, the off-diagonal weights are stored on both entries (i, j) and (j, i) of vec(G).
+        G_i, G_j, G_val, F_ind, F_val, cons = expression_to_sparse_matrices(constraint.expression)
+        G_i, G_j, F_ind = G_i.astype(int), G_j.astype(int), F_ind.astype(int)
+        off_diagonal = G_i != G_j
+        data["G_rows"].append(np.full(G_val.size + np.sum(off_diagonal), row))
+        data["G_cols"].append(np.concatenate([G_i * Point.counter + G_j,
+                                              G_j[off_diagonal] * Point.counter + G_i[off_diagonal]]))
+        data["G_vals"].append(np.concatenate([G_val, G_val[off_diagonal]]))
+        data["F_rows"].append(np.full(F_val.size, row))
+        data["F_cols"].append(F_ind)
+        data["F_vals"].append(F_val)
+        data["constants"].append(cons)
 
     def send_lmi_constraint_to_solver(self, psd_counter, psd_matrix):
         """
@@ -164,6 +196,7 @@ class CvxpyWrapper(Wrapper):
 
         # Store the lmi constraint
         cvxpy_constraints_list = [M >> 0]
+        self._dual_references.append(cvxpy_constraints_list[0])
 
         # Store one correspondence constraint per entry of the matrix
         for i in range(psd_matrix.shape[0]):
@@ -193,37 +226,28 @@ class CvxpyWrapper(Wrapper):
         """
 
         assert self._list_of_solver_constraints == self.prob.constraints
-        dual_values_temp = [constraint.dual_value for constraint in self.prob.constraints]
         dual_values = list()
 
         # Store residual, dual value of the main lmi
-        residual = dual_values_temp[0]
+        residual = self._list_of_solver_constraints[0].dual_value
         dual_values.append(residual)
         assert residual.shape == (Point.counter, Point.counter)
 
-        # Set counter
-        counter = 1
-        counter2 = 1  # number of dual variables (no artificial ones due to LMI)
-
-        for constraint_or_psd in self._list_of_constraints_sent_to_solver:
+        for constraint_or_psd, dual_reference in zip(self._list_of_constraints_sent_to_solver,
+                                                     self._dual_references):
             if isinstance(constraint_or_psd, Constraint):
-                dual_values.append(dual_values_temp[counter])
-                counter += 1
-                counter2 += 1
+                equality_or_inequality, row = dual_reference
+                dual_values.append(float(self._scalar_solver_constraints[equality_or_inequality].dual_value[row]))
             elif isinstance(constraint_or_psd, PSDMatrix):
-                assert dual_values_temp[counter].shape == constraint_or_psd.shape
-                dual_values.append(dual_values_temp[counter])
-                counter += 1
-                counter2 += 1
-                size = constraint_or_psd.shape[0] * constraint_or_psd.shape[1]
-                counter += size
+                assert dual_reference.dual_value.shape == constraint_or_psd.shape
+                dual_values.append(dual_reference.dual_value)
             else:
                 raise TypeError("The list of constraints that are sent to CVXPY should contain only"
                                 "\'Constraint\' objects of \'PSDMatrix\' objects."
                                 "Got {}".format(type(constraint_or_psd)))
 
         # Verify nothing is left
-        assert len(dual_values) == counter2
+        assert len(dual_values) == len(self._list_of_constraints_sent_to_solver) + 1
 
         # Return the position of the reached performance metric
         return dual_values, residual
@@ -241,7 +265,28 @@ class CvxpyWrapper(Wrapper):
 
         """
         import cvxpy as cp
-        
+        from scipy.sparse import csr_matrix
+
+        # Send all the scalar constraints of each type to CVXPY as one vectorized constraint
+        G_vector = cp.reshape(self.G, (Point.counter ** 2,), order="F")
+        for equality_or_inequality, data in self._scalar_constraints_data.items():
+            nb_constraints = len(data["constants"])
+            if nb_constraints == 0:
+                continue
+            G_weights = csr_matrix((np.concatenate(data["G_vals"]),
+                                    (np.concatenate(data["G_rows"]), np.concatenate(data["G_cols"]))),
+                                   shape=(nb_constraints, Point.counter ** 2))
+            F_weights = csr_matrix((np.concatenate(data["F_vals"]),
+                                    (np.concatenate(data["F_rows"]), np.concatenate(data["F_cols"]))),
+                                   shape=(nb_constraints, Expression.counter))
+            cvxpy_expression = G_weights @ G_vector + F_weights @ self.F + np.array(data["constants"])
+            if equality_or_inequality == 'inequality':
+                cvxpy_constraint = cvxpy_expression <= 0
+            else:
+                cvxpy_constraint = cvxpy_expression == 0
+            self._scalar_solver_constraints[equality_or_inequality] = cvxpy_constraint
+            self._list_of_solver_constraints.append(cvxpy_constraint)
+
         cvxpy_objective = self._expression_to_solver(objective)
         self.objective = cvxpy_objective
         self.prob = cp.Problem(objective=cp.Maximize(cvxpy_objective), constraints=self._list_of_solver_constraints)
@@ -336,6 +381,13 @@ class CvxpyWrapper(Wrapper):
         """
         import cvxpy as cp
 
-        obj = cp.sum(cp.multiply(self.G, weight))
-        self.prob = cp.Problem(objective=cp.Minimize(obj), constraints=self._list_of_solver_constraints)
+        # Build the heuristic problem only once, with the weight as a parameter.
+        # Successive calls (e.g., iterations of the logdet heuristic) then only update the value of the weight,
+        # and CVXPY reuses the canonicalization computed on the first solve.
+        if self._heuristic_weight is None:
+            self._heuristic_weight = cp.Parameter(self.G.shape)
+            obj = cp.sum(cp.multiply(self.G, self._heuristic_weight))
+            self.prob = cp.Problem(objective=cp.Minimize(obj), constraints=self._list_of_solver_constraints)
+
+        self._heuristic_weight.value = weight
         return self.prob
@@ -1,6 +1,7 @@
 import unittest
 
-from PEPit.tools.dict_operations import merge_dict, prune_dict, multiply_dicts, symmetrize_dict
+from PEPit.tools.dict_operations import merge_dict, add_weighted_dict_inplace, prune_dict, multiply_dicts, \
+    symmetrize_dict
 
 
 class TestDictOperations(unittest.TestCase):
@@ -13,6 +14,12 @@ class TestDictOperations(unittest.TestCase):
         summed_dict = {'a': 7, 'b': 14, 'q': 11, 'w': 0}
         self.assertEqual(merge_dict(dict1=self.dict1, dict2=self.dict2), summed_dict)
 
+    def test_add_weighted_dict_inplace(self):
+        weighted_summed_dict = {'a': 9, 'b': 22, 'q': 11, 'w': 0}
+        updated_dict = add_weighted_dict_inplace(dict1=self.dict1, dict2=self.dict2, weight=2)
+        self.assertIs(updated_dict, self.dict1)
+        self.assertEqual(self.dict1, weighted_summed_dict)
+
     def test_multiply_dicts(self):
 
         product_dict = {('a', 'a'): 10, ('a', 'b'): 40, ('a', 'w'): 0,
@@ -1,4 +1,6 @@
+import io
 import unittest
+from contextlib import redirect_stdout
 
 import numpy as np
 
@@ -432,6 +434,17 @@ class TestExamplesCVXPY(unittest.TestCase):
         wc, theory = wc_improved_interior_algorithm(L, mu, c, lam, n, wrapper=self.wrapper, verbose=self.verbose)
         self.assertLessEqual(wc, theory)
 
+    def test_improved_interior_algorithm_cached(self):
+        L, mu, c, n = 1, 1, 1, 2
+        lam = 1 / L
+
+        # The second call returns the stored guarantee and says so, whatever the verbose of the first call.
+        wc, _ = wc_improved_interior_algorithm(L, mu, c, lam, n, wrapper=self.wrapper, verbose=-1)
+        with redirect_stdout(io.StringIO()) as output:
+            wc_cached, _ = wc_improved_interior_algorithm(L, mu, c, lam, n, wrapper=self.wrapper, verbose=1)
+        self.assertEqual(wc, wc_cached)
+        self.assertIn("(PEPit) Cached result", output.getvalue())
+
     def test_no_lips_in_bregman_divergence(self):
         L, n = 0.1, 3
         gamma = 1 / L
@@ -446,6 +459,25 @@ class TestExamplesCVXPY(unittest.TestCase):
         wc, theory = wc_no_lips_in_function_value(L, gamma, n, wrapper=self.wrapper, verbose=self.verbose)
         self.assertAlmostEqual(wc, theory, delta=self.relative_precision * theory)
 
+    def test_no_lips_in_function_value_exact(self):
+        L, n = 1, 3
+
+        # The closed form is also tight for step-sizes smaller than 1/L.
+        for gamma in [1 / L / 2, 0.3 / L]:
+            wc, theory = wc_no_lips_in_function_value(L, gamma, n, wrapper=self.wrapper, verbose=self.verbose)
+            wc_exact, _ = wc_no_lips_in_function_value(L, gamma, n, wrapper=self.wrapper, verbose=self.verbose,
+                                                       exact=True)
+            self.assertAlmostEqual(wc, wc_exact, delta=self.relative_precision * theory)
+
+    def test_no_lips_in_function_value_exact_large_step_size(self):
+        L, n = 1, 3
+        gamma = 1.5 / L
+
+        # The closed form does not apply for step-sizes larger than 1/L: the PEP is solved, and found unbounded.
+        wc, theory = wc_no_lips_in_function_value(L, gamma, n, wrapper=self.wrapper, verbose=self.verbose, exact=True)
+        self.assertIsNone(wc)
+        self.assertIsNotNone(theory)
+
     def test_proximal_gradient(self):
         L, mu, gamma, n = 1, .1, 1, 2
 
@@ -0,0 +1,45 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from PEPit.tools.memoize import memoize_pep
+
+
+class TestMemoize(unittest.TestCase):
+
+    def setUp(self):
+
+        self.calls = list()
+
+        @memoize_pep(maxsize=2)
+        def solve_pep(a, b, verbose):
+            self.calls.append((a, b, verbose))
+            return a + b
+
+        self.solve_pep = solve_pep
+
+    def test_memoize_pep(self):
+
+        # A second call with the same parameters, whatever its verbose, does not solve the PEP again.
+        self.assertEqual(self.solve_pep(1, 2, verbose=0), 3)
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(self.solve_pep(1, 2, verbose=1), 3)
+        self.assertEqual(self.calls, [(1, 2, 0)])
+        self.assertIn("(PEPit) Cached result", output.getvalue())
+
+        # No message is printed without verbose.
+        with redirect_stdout(io.StringIO()) as output:
+            self.solve_pep(1, 2, verbose=0)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_maxsize(self):
+
+        # The least recently used result is discarded once more than maxsize results are stored.
+        self.solve_pep(1, 1, verbose=0)
+        self.solve_pep(2, 2, verbose=0)
+        self.solve_pep(1, 1, verbose=0)
+        self.solve_pep(3, 3, verbose=0)
+        self.solve_pep(2, 2, verbose=0)
+        self.solve_pep(1, 1, verbose=0)
+
+        self.assertEqual([call[:2] for call in self.calls], [(1, 1), (2, 2), (3, 3), (2, 2), (1, 1)])
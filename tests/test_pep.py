@@ -167,6 +167,13 @@ class TestPEP(unittest.TestCase):
 
         self.assertEqual(len(l1), len(l2))
 
+    def test_solve_returns_float(self):
+
+        # The worst-case guarantee must be a Python float, not a numpy scalar.
+        pepit_tau = self.problem.solve(verbose=self.verbose)
+
+        self.assertIs(type(pepit_tau), float)
+
     def test_dimension_reduction(self):
 
         # Compute pepit_tau very basically.
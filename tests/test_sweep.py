@@ -0,0 +1,24 @@
+import unittest
+
+from PEPit.examples.unconstrained_convex_minimization import wc_gradient_descent
+from PEPit.tools.sweep import sweep
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+
+        self.grid = [{"L": 1, "gamma": 1, "n": n} for n in range(1, 4)]
+        self.relative_precision = 10 ** -3
+
+    def test_sweep(self):
+
+        # Solve the grid sequentially and in parallel.
+        sequential_results = sweep(wc_gradient_descent, self.grid, workers=1, verbose=-1)
+        parallel_results = sweep(wc_gradient_descent, self.grid, workers=2, verbose=-1)
+
+        # Results must be returned in the order of the grid, whatever the number of workers.
+        self.assertEqual(len(parallel_results), len(self.grid))
+        for (wc, theory), (parallel_wc, parallel_theory) in zip(sequential_results, parallel_results):
+            self.assertEqual(theory, parallel_theory)
+            self.assertAlmostEqual(wc, parallel_wc, delta=self.relative_precision * theory)
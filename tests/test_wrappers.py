@@ -95,6 +95,34 @@ class TestWrapperCVXPY(unittest.TestCase):
         self.assertIs(dual_values[0], residual)
         self.assertEqual(residual.shape, (3, 3))
 
+    def test_dual_values_of_known_pep(self):
+
+        # Contraction of gradient descent with step-size 1/L, whose optimal dual variables are known:
+        # 1 for the performance metric, rho^2 for the initial condition and 2 rho / L for both interpolation constraints,
+        # with rho = 1 - mu / L. The equality initial condition is the only constraint of its type.
+        problem = PEP()
+        func = problem.declare_function(SmoothStronglyConvexFunction, mu=self.mu, L=self.L)
+        xs = func.stationary_point()
+        x0 = problem.set_initial_point()
+        initial_condition = (x0 - xs) ** 2 == 1
+        problem.set_initial_condition(initial_condition)
+        x1 = x0 - 1 / self.L * func.gradient(x0)
+        problem.set_performance_metric((x1 - xs) ** 2)
+        problem.solve(verbose=self.verbose, wrapper=self.wrapper)
+
+        # Compare the dual values of each constraint to the known ones.
+        rho = 1 - self.mu / self.L
+        class_constraints = func.list_of_class_constraints
+        self.assertEqual(len(class_constraints), 2)
+        self.assertIs(type(initial_condition.eval_dual()), float)
+        self.assertAlmostEqual(initial_condition.eval_dual(), rho ** 2, delta=10 ** -5)
+        for constraint in class_constraints:
+            self.assertIs(type(constraint.eval_dual()), float)
+            self.assertAlmostEqual(constraint.eval_dual(), 2 * rho / self.L, delta=10 ** -5)
+        for constraint in problem._list_of_constraints_sent_to_wrapper:
+            if constraint is not initial_condition and constraint not in class_constraints:
+                self.assertAlmostEqual(constraint.eval_dual(), 1, delta=10 ** -5)
+
     def test_dual_sign_in_equality_constraints(self):
 
         # The equality 1 = some_expression does not lead to the same constraint's expression based on the class of 1.